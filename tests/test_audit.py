@@ -0,0 +1,52 @@
+from uxaudit.audit import _analyze_group
+from uxaudit.schema import PageTarget, ScreenshotArtifact, SectionTarget
+
+
+class StubClient:
+    def __init__(self) -> None:
+        self.single_prompts: list[str] = []
+
+    def analyze_images_batch(self, instructions, prompts, images):
+        return None, "batch raw"
+
+    def analyze_image(self, prompt, image):
+        self.single_prompts.append(prompt)
+        return {"summary": image.decode()}, f"raw {image.decode()}"
+
+
+def test_analyze_group_falls_back_to_one_shot_at_a_time():
+    page = PageTarget(id="page-1", url="https://example.com")
+    section = SectionTarget(id="section-1", page_id="page-1", title="Hero")
+    group = [
+        (
+            ScreenshotArtifact(
+                id="shot-1", page_id="page-1", path="a.png", width=1, height=1
+            ),
+            b"full",
+            None,
+        ),
+        (
+            ScreenshotArtifact(
+                id="shot-1-s1",
+                page_id="page-1",
+                section_id="section-1",
+                path="b.png",
+                kind="section",
+                width=1,
+                height=1,
+            ),
+            b"hero",
+            section,
+        ),
+    ]
+    client = StubClient()
+
+    analyses, raw_records = _analyze_group(client, page, group, None)
+
+    assert analyses == [{"summary": "full"}, {"summary": "hero"}]
+    assert raw_records == [
+        (["shot-1", "shot-1-s1"], "batch raw"),
+        (["shot-1"], "raw full"),
+        (["shot-1-s1"], "raw hero"),
+    ]
+    assert len(client.single_prompts) == 2
@@ -0,0 +1,31 @@
+from uxaudit.crawl_index import CrawlIndex
+
+
+def test_crawl_index_returns_recently_marked_urls(tmp_path):
+    index = CrawlIndex(tmp_path / "runs" / "seen.db", "anonymous")
+    try:
+        index.mark([("https://example.com/about", ["https://example.com/team"])])
+        assert index.recent(3600) == {
+            "https://example.com/about": ["https://example.com/team"]
+        }
+        assert index.recent(-1) == {}
+    finally:
+        index.close()
+
+    reopened = CrawlIndex(tmp_path / "runs" / "seen.db", "anonymous")
+    try:
+        assert list(reopened.recent(3600)) == ["https://example.com/about"]
+    finally:
+        reopened.close()
+
+
+def test_crawl_index_keeps_scopes_apart(tmp_path):
+    anonymous = CrawlIndex(tmp_path / "seen.db", "anonymous")
+    logged_in = CrawlIndex(tmp_path / "seen.db", "form:alice")
+    try:
+        logged_in.mark([("https://example.com/account", [])])
+        assert anonymous.recent(3600) == {}
+        assert list(logged_in.recent(3600)) == ["https://example.com/account"]
+    finally:
+        anonymous.close()
+        logged_in.close()
@@ -0,0 +1,20 @@
+from uxaudit.crawler import filter_links, normalize_url
+
+
+def test_normalize_url_drops_fragment_and_trailing_slash():
+    assert normalize_url("https://Example.com/pricing/#plans") == (
+        "https://example.com/pricing"
+    )
+    assert normalize_url("https://example.com") == "https://example.com/"
+
+
+def test_filter_links_keeps_same_site_http_links_once():
+    links = [
+        "https://example.com/about/",
+        "https://example.com/about#team",
+        "https://example.com/about/",
+        "mailto:hello@example.com",
+        "https://other.example.org/",
+        "",
+    ]
+    assert filter_links(links, "https://example.com") == ["https://example.com/about"]
@@ -0,0 +1,195 @@
+import io
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+from uxaudit.gemini_client import (
+    GeminiClient,
+    _compress_image,
+    _decorrelated_jitter,
+    _sniff_mime_type,
+    _split_batch_results,
+)
+from uxaudit.llm_cache import ResponseCache
+
+
+def test_split_batch_results_reads_results_key():
+    parsed = {"results": [{"summary": "a"}, {"summary": "b"}]}
+    assert _split_batch_results(parsed, 2) == [{"summary": "a"}, {"summary": "b"}]
+
+
+def test_split_batch_results_accepts_top_level_list():
+    assert _split_batch_results([{"summary": "a"}], 1) == [{"summary": "a"}]
+
+
+def test_split_batch_results_pads_and_truncates():
+    assert _split_batch_results({"results": [{"summary": "a"}]}, 3) == [
+        {"summary": "a"},
+        {},
+        {},
+    ]
+    assert _split_batch_results([{}, {}, {}], 2) == [{}, {}]
+
+
+def test_split_batch_results_ignores_malformed_items():
+    assert _split_batch_results({"results": ["text", 3]}, 2) == [{}, {}]
+
+
+def test_split_batch_results_rejects_replies_without_results(caplog):
+    assert _split_batch_results({"summary": "no results"}, 2) is None
+    assert "no results list" in caplog.text
+
+
+def test_split_batch_results_warns_on_count_mismatch(caplog):
+    assert _split_batch_results([{"summary": "a"}], 2) == [{"summary": "a"}, {}]
+    assert "1 results for 2 images" in caplog.text
+
+
+def test_sniff_mime_type_detects_screenshot_formats():
+    assert _sniff_mime_type(b"\x89PNG\r\n\x1a\n") == "image/png"
+    assert _sniff_mime_type(b"\xff\xd8\xff\xe0") == "image/jpeg"
+    assert _sniff_mime_type(b"RIFF\x00\x00\x00\x00WEBPVP8 ") == "image/webp"
+
+
+def test_compress_image_downscales_to_webp():
+    buffer = io.BytesIO()
+    Image.new("RGBA", (1440, 4000), (20, 40, 60, 255)).save(buffer, "PNG")
+
+    data = _compress_image(buffer.getvalue(), max_width=1000, quality=80)
+
+    assert _sniff_mime_type(data) == "image/webp"
+    with Image.open(io.BytesIO(data)) as img:
+        assert img.width == 1000
+
+
+def test_compress_image_keeps_tall_pages_readable():
+    buffer = io.BytesIO()
+    Image.new("RGB", (1800, 9000), (20, 40, 60)).save(buffer, "PNG")
+
+    data = _compress_image(buffer.getvalue(), max_width=1440, quality=80)
+
+    with Image.open(io.BytesIO(data)) as img:
+        assert img.size == (1440, 7200)
+
+
+def test_compress_image_returns_original_bytes_on_decode_error():
+    assert _compress_image(b"not an image", max_width=1000, quality=80) == (
+        b"not an image"
+    )
+
+
+def test_decorrelated_jitter_stays_within_bounds():
+    for _ in range(100):
+        delay = _decorrelated_jitter(4.0, base=1.0, cap=8.0)
+        assert 1.0 <= delay <= 8.0
+
+
+def test_call_with_retry_gives_up_at_deadline(monkeypatch):
+    client = GeminiClient(api_key="test", model="flash")
+    client.total_budget_s = 0.0
+    sleeps: list[float] = []
+    monkeypatch.setattr("uxaudit.gemini_client.time.sleep", sleeps.append)
+    calls = []
+
+    def failing_call(http_options):
+        calls.append(1)
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        client._call_with_retry(failing_call)
+    assert len(calls) == 1
+    assert sleeps == []
+
+
+def test_call_with_retry_retries_until_success(monkeypatch):
+    client = GeminiClient(api_key="test", model="flash")
+    monkeypatch.setattr("uxaudit.gemini_client.time.sleep", lambda _: None)
+    attempts = iter([RuntimeError("flaky"), RuntimeError("flaky"), None])
+    timeouts: list[int] = []
+
+    def flaky_call(http_options):
+        timeouts.append(http_options.timeout)
+        error = next(attempts)
+        if error is not None:
+            raise error
+        return "ok"
+
+    assert client._call_with_retry(flaky_call) == "ok"
+    assert timeouts == [client.request_timeout_ms] * 3
+
+
+def test_compress_image_passes_through_small_lossy_images():
+    buffer = io.BytesIO()
+    Image.new("RGB", (800, 600), (20, 40, 60)).save(buffer, "JPEG")
+    data = buffer.getvalue()
+
+    assert _compress_image(data, max_width=1000, quality=80) is data
+    assert _sniff_mime_type(_compress_image(data, max_width=500, quality=80)) == (
+        "image/webp"
+    )
+
+
+def test_gemini_clients_share_sdk_client_per_key():
+    first = GeminiClient(api_key="test", model="flash")
+    second = GeminiClient(api_key="test", model="pro")
+    other = GeminiClient(api_key="other", model="flash")
+
+    assert first.client is second.client
+    assert first.client is not other.client
+
+
+def test_compress_image_encodes_rgb_png_without_resizing():
+    buffer = io.BytesIO()
+    Image.new("RGB", (800, 600), (20, 40, 60)).save(buffer, "PNG")
+
+    data = _compress_image(buffer.getvalue(), max_width=1000, quality=80)
+
+    with Image.open(io.BytesIO(data)) as img:
+        assert img.format == "WEBP"
+        assert img.size == (800, 600)
+
+
+def _stub_sdk(replies: list[str]) -> tuple[SimpleNamespace, list[str]]:
+    calls: list[str] = []
+
+    def generate_content(**kwargs):
+        calls.append(kwargs["model"])
+        return SimpleNamespace(text=replies[len(calls) - 1])
+
+    return SimpleNamespace(
+        models=SimpleNamespace(generate_content=generate_content)
+    ), calls
+
+
+def test_generate_does_not_cache_unparseable_replies(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.db")
+    client = GeminiClient(api_key="test", model="flash", cache=cache)
+    client.client, calls = _stub_sdk(["I can't help with that.", '{"summary": "ok"}'])
+    try:
+        assert client.analyze_images("prompt", [b"image"]) == (
+            {},
+            "I can't help with that.",
+        )
+        assert client.analyze_images("prompt", [b"image"]) == (
+            {"summary": "ok"},
+            '{"summary": "ok"}',
+        )
+        assert client.analyze_images("prompt", [b"image"])[0] == {"summary": "ok"}
+    finally:
+        cache.close()
+    assert len(calls) == 2
+
+
+def test_generate_does_not_cache_batch_replies_without_results(tmp_path):
+    cache = ResponseCache(tmp_path / "responses.db")
+    client = GeminiClient(api_key="test", model="flash", cache=cache)
+    client.client, calls = _stub_sdk(['{"summary": "one"}', '{"results": [{}, {}]}'])
+    try:
+        batch = ("instructions", ["a", "b"], [b"one", b"two"])
+        assert client.analyze_images_batch(*batch)[0] is None
+        assert client.analyze_images_batch(*batch)[0] == [{}, {}]
+        assert client.analyze_images_batch(*batch)[0] == [{}, {}]
+    finally:
+        cache.close()
+    assert len(calls) == 2
@@ -0,0 +1,35 @@
+from uxaudit.llm_cache import ResponseCache, cache_key
+
+
+def test_cache_key_depends_on_model_and_parts():
+    key = cache_key("flash", ["prompt", b"image"])
+    assert key == cache_key("flash", ["prompt", b"image"])
+    assert key != cache_key("pro", ["prompt", b"image"])
+    assert key != cache_key("flash", ["prompt", b"other"])
+    assert cache_key("flash", ["ab", "c"]) != cache_key("flash", ["a", "bc"])
+
+
+def test_response_cache_round_trip_and_expiry(tmp_path):
+    cache = ResponseCache(tmp_path / "cache" / "responses.db", ttl_s=60)
+    try:
+        assert cache.get("missing") is None
+        cache.set("key", '{"summary": "ok"}')
+        assert cache.get("key") == '{"summary": "ok"}'
+        cache.ttl_s = -1
+        assert cache.get("key") is None
+    finally:
+        cache.close()
+
+
+def test_response_cache_purges_expired_rows_on_open(tmp_path):
+    path = tmp_path / "responses.db"
+    cache = ResponseCache(path)
+    cache.set("old", "{}")
+    cache.close()
+
+    reopened = ResponseCache(path, ttl_s=-1)
+    try:
+        rows = reopened._conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        assert rows == (0,)
+    finally:
+        reopened.close()
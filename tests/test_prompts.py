@@ -0,0 +1,60 @@
+import pytest
+
+from uxaudit.prompts import (
+    CONSISTENCY_PROMPT_TEMPLATE,
+    PROMPT_INSTRUCTIONS,
+    REDESIGN_PROMPT_TEMPLATE,
+    _compile_template,
+    build_consistency_prompt,
+    build_prompt,
+    build_redesign_prompt,
+)
+from uxaudit.schema import PageTarget, SectionTarget
+
+
+def test_build_prompt_keeps_static_instructions_as_prefix():
+    page = PageTarget(id="page-1", url="https://example.com", title="Home")
+    section = SectionTarget(
+        id="section-1-1", page_id="page-1", title="Hero", selector="section#hero"
+    )
+
+    page_prompt = build_prompt(page, "shot-1", auth_state="authenticated")
+    section_prompt = build_prompt(page, "shot-1-s1", section, "authenticated")
+
+    assert page_prompt.startswith(PROMPT_INSTRUCTIONS)
+    assert section_prompt.startswith(PROMPT_INSTRUCTIONS)
+    assert "Screenshot id: shot-1-s1" in section_prompt
+    assert "Section selector: section#hero" in section_prompt
+
+
+def test_prompt_templates_render_like_str_format():
+    page = PageTarget(id="page-1", url="https://example.com/{id}", title="Home")
+
+    assert build_consistency_prompt("- shot-1 {x}") == (
+        CONSISTENCY_PROMPT_TEMPLATE.format(shots_block="- shot-1 {x}")
+    )
+    assert build_redesign_prompt(page, 3, "Brief", "pre_login") == (
+        REDESIGN_PROMPT_TEMPLATE.format(
+            page_url=page.url,
+            page_title="Home",
+            auth_state="pre_login",
+            variants=3,
+            brief_block="Brief",
+        )
+    )
+
+
+def test_prompt_example_does_not_suggest_a_fixed_screenshot_id():
+    page = PageTarget(id="page-2", url="https://example.com/about", title="About")
+
+    prompt = build_prompt(page, "shot-2")
+
+    assert '"screenshot_id": "shot-1"' not in prompt
+    assert "Screenshot id: shot-2" in prompt
+
+
+def test_compile_template_rejects_conversions_and_format_specs():
+    with pytest.raises(ValueError):
+        _compile_template("{name!r}")
+    with pytest.raises(ValueError):
+        _compile_template("{name:>5}")
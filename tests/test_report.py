@@ -0,0 +1,39 @@
+import orjson
+
+from uxaudit.report import NdjsonWriter, write_json
+from uxaudit.utils import extract_json
+
+
+def test_ndjson_writer_creates_file_lazily(tmp_path):
+    writer = NdjsonWriter(tmp_path / "raw.ndjson")
+    writer.close()
+    assert not writer.path.exists()
+    assert writer.count == 0
+
+
+def test_ndjson_writer_writes_one_record_per_line(tmp_path):
+    writer = NdjsonWriter(tmp_path / "raw.ndjson")
+    writer.write({"screenshot_ids": ["shot-1"], "raw": '{"summary": "ok"}'})
+    writer.write({"screenshot_ids": ["shot-2"], "raw": "café"})
+    writer.close()
+
+    lines = writer.path.read_bytes().splitlines()
+    assert writer.count == 2
+    assert [orjson.loads(line)["raw"] for line in lines] == [
+        '{"summary": "ok"}',
+        "café",
+    ]
+
+
+def test_write_json_falls_back_for_values_orjson_rejects(tmp_path):
+    parsed = extract_json(
+        '{"summary": "emoji half \\ud83d here", "n": 18446744073709551616}'
+    )
+
+    write_json(tmp_path / "report.json", parsed)
+    writer = NdjsonWriter(tmp_path / "raw.ndjson")
+    writer.write({"analysis": parsed})
+    writer.close()
+
+    assert "\\ud83d" in (tmp_path / "report.json").read_text()
+    assert "18446744073709551616" in writer.path.read_text()
@@ -0,0 +1,17 @@
+from uxaudit.utils import extract_json
+
+
+def test_extract_json_parses_fenced_object():
+    text = '```json\n{"summary": "ok", "recommendations": []}\n```'
+    assert extract_json(text) == {"summary": "ok", "recommendations": []}
+
+
+def test_extract_json_finds_object_inside_prose():
+    text = 'Here is the audit:\n{"summary": "ok"}\nThanks!'
+    assert extract_json(text) == {"summary": "ok"}
+
+
+def test_extract_json_falls_back_to_stdlib_for_non_standard_values():
+    parsed = extract_json('{"score": NaN}')
+    assert isinstance(parsed, dict)
+    assert parsed["score"] != parsed["score"]
@@ -9,9 +9,9 @@ Priority = Literal["P0", "P1", "P2"]
 Impact = Literal["H", "M", "L"]
 Effort = Literal["S", "M", "L"]
 
-PRIORITIES: set[Priority] = {"P0", "P1", "P2"}
-IMPACTS: set[Impact] = {"H", "M", "L"}
-EFFORTS: set[Effort] = {"S", "M", "L"}
+PRIORITIES: frozenset[Priority] = frozenset({"P0", "P1", "P2"})
+IMPACTS: frozenset[Impact] = frozenset({"H", "M", "L"})
+EFFORTS: frozenset[Effort] = frozenset({"S", "M", "L"})
 
 TChoice = TypeVar("TChoice", bound=str)
 
@@ -70,10 +70,13 @@ def _normalize_tags(value: Iterable[str] | str | None) -> list[str]:
 
 
 def _normalize_choice(
-    value: str | None, allowed: set[TChoice], default: TChoice
+    value: str | None, allowed: frozenset[TChoice], default: TChoice
 ) -> TChoice:
     if not value:
         return default
+    # Most model output is already canonical; skip the str/upper round trip.
+    if isinstance(value, str) and value in allowed:
+        return cast(TChoice, value)
     normalized = str(value).upper()
     if normalized in allowed:
         return cast(TChoice, normalized)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -9,13 +10,20 @@ from playwright.sync_api import HttpCredentials
 
 from uxaudit.aggregate import normalize_recommendations
 from uxaudit.auth import AuthResult, perform_login
-from uxaudit.browser import BrowserConfig, browser_context
-from uxaudit.capture import capture_full_page
+from uxaudit.browser import BrowserConfig, browser_context, browser_session
+from uxaudit.capture import capture_full_page, screenshot_suffix
 from uxaudit.config import AuditConfig, AuthConfig, Settings
+from uxaudit.crawl_index import CrawlIndex
 from uxaudit.crawler import filter_links, normalize_url
 from uxaudit.gemini_client import GeminiClient
-from uxaudit.prompts import build_consistency_prompt, build_prompt
-from uxaudit.report import write_json
+from uxaudit.llm_cache import ResponseCache
+from uxaudit.prompts import (
+    build_batch_prompt,
+    build_consistency_prompt,
+    build_prompt,
+    build_prompt_context,
+)
+from uxaudit.report import NdjsonWriter, write_json
 from uxaudit.schema import (
     AuditResult,
     AuthState,
@@ -29,6 +37,9 @@ from uxaudit.utils import build_run_id, ensure_dir
 
 logger = logging.getLogger(__name__)
 
+RAW_RESPONSES_FILENAME = "raw_responses.ndjson"
+CRAWL_INDEX_FILENAME = "seen.db"
+
 
 def run_audit(config: AuditConfig, settings: Settings) -> tuple[AuditResult, Path]:
     _validate_limits(config)
@@ -40,22 +51,39 @@ def run_audit(config: AuditConfig, settings: Settings) -> tuple[AuditResult, Pat
 
     started_at = datetime.now(timezone.utc)
 
-    client = GeminiClient(api_key=settings.api_key or "", model=config.model)
+    auth = _resolve_auth(config, settings)
+    auth_enabled = auth is not None
+    auth_summary = None
+    if auth_enabled and config.max_total_screenshots < 2:
+        raise ValueError(
+            "Authentication requires at least 2 screenshots for pre/post login capture"
+        )
+
+    cache = None
+    if config.llm_cache:
+        cache = ResponseCache(
+            config.output_dir / ".llm_cache" / "responses.db",
+            ttl_s=config.llm_cache_ttl_s,
+        )
+    client = GeminiClient(
+        api_key=settings.api_key or "",
+        model=config.model,
+        cache=cache,
+        image_quality=config.analysis_image_quality,
+        max_image_width=config.analysis_max_width,
+        total_budget_s=config.analysis_total_budget_s,
+    )
 
     pages: list[PageTarget] = []
     sections: list[SectionTarget] = []
     screenshots: list[ScreenshotArtifact] = []
     recommendations = []
     analysis_items: list[dict] = []
-    raw_responses: list[str] = []
+    raw_responses = NdjsonWriter(run_dir / RAW_RESPONSES_FILENAME)
 
     page_counter = 0
     remaining_screenshots = config.max_total_screenshots
 
-    auth = _resolve_auth(config, settings)
-    auth_enabled = auth is not None
-    auth_summary = None
-
     browser_config = BrowserConfig(
         viewport_width=config.viewport_width,
         viewport_height=config.viewport_height,
@@ -63,30 +91,57 @@ def run_audit(config: AuditConfig, settings: Settings) -> tuple[AuditResult, Pat
         headless=config.headless,
     )
 
+    executor = ThreadPoolExecutor(max_workers=config.analysis_concurrency)
+    max_pending = config.analysis_concurrency * 2
+    pending: deque[
+        tuple[
+            Future[tuple[list[dict | list], list[tuple[list[str], str]]]],
+            PageTarget,
+            list[tuple[ScreenshotArtifact, bytes, SectionTarget | None]],
+            AuthState | None,
+        ]
+    ] = deque()
+
     def analyze_and_collect(
         page: PageTarget,
-        screenshot: ScreenshotArtifact,
-        image_path: Path,
-        section: SectionTarget | None = None,
+        shots: list[tuple[ScreenshotArtifact, bytes, SectionTarget | None]],
         auth_state: AuthState | None = None,
     ) -> None:
-        prompt = build_prompt(page, screenshot.id, section, auth_state)
-        analysis, raw_response = client.analyze_image(prompt, image_path)
-        recommendations.extend(normalize_recommendations(analysis))
-        analysis_items.append(
-            {
-                "page_id": page.id,
-                "section_id": section.id if section else None,
-                "screenshot_id": screenshot.id,
-                "url": page.url,
-                "title": page.title,
-                "section_title": section.title if section else None,
-                "auth_state": auth_state,
-                "analysis": analysis if isinstance(analysis, dict) else None,
-            }
-        )
-        if raw_response:
-            raw_responses.append(raw_response)
+        groups = [shots] if config.batch_analysis else [[shot] for shot in shots]
+        for group in groups:
+            future = executor.submit(_analyze_group, client, page, group, auth_state)
+            pending.append((future, page, group, auth_state))
+        collect_analyses(wait=False)
+
+    def collect_analyses(wait: bool) -> None:
+        # Results are consumed in submission order so the report stays
+        # deterministic regardless of which analysis finishes first. Pending
+        # work holds screenshot bytes, so block once the backlog gets long.
+        while pending and (wait or pending[0][0].done() or len(pending) > max_pending):
+            future, page, group, auth_state = pending.popleft()
+            analyses, raw_records = future.result()
+            for (screenshot, _, section), analysis in zip(group, analyses, strict=True):
+                recommendations.extend(normalize_recommendations(analysis))
+                analysis_items.append(
+                    {
+                        "page_id": page.id,
+                        "section_id": section.id if section else None,
+                        "screenshot_id": screenshot.id,
+                        "url": page.url,
+                        "title": page.title,
+                        "section_title": section.title if section else None,
+                        "auth_state": auth_state,
+                        "analysis": analysis if isinstance(analysis, dict) else None,
+                    }
+                )
+            for screenshot_ids, raw_response in raw_records:
+                raw_responses.write(
+                    {
+                        "page_id": page.id,
+                        "screenshot_ids": screenshot_ids,
+                        "raw": raw_response,
+                    }
+                )
 
     def capture_page(
         context,
@@ -99,7 +154,9 @@ def run_audit(config: AuditConfig, settings: Settings) -> tuple[AuditResult, Pat
             return None
 
         page_counter += 1
-        screenshot_path = screenshots_dir / f"page-{page_counter}.png"
+        screenshot_path = (
+            screenshots_dir / f"page-{page_counter}{screenshot_suffix(config)}"
+        )
         max_sections = 0
         if allow_sections:
             max_sections = min(
@@ -135,8 +192,9 @@ def run_audit(config: AuditConfig, settings: Settings) -> tuple[AuditResult, Pat
         pages.append(page)
         screenshots.append(screenshot)
         remaining_screenshots -= 1
-
-        analyze_and_collect(page, screenshot, screenshot_path, None, auth_state)
+        shots: list[tuple[ScreenshotArtifact, bytes, SectionTarget | None]] = [
+            (screenshot, capture.data, None)
+        ]
 
         for section_index, section_capture in enumerate(capture.sections, start=1):
             if remaining_screenshots <= 0:
@@ -161,75 +219,105 @@ def run_audit(config: AuditConfig, settings: Settings) -> tuple[AuditResult, Pat
             )
             screenshots.append(section_shot)
             remaining_screenshots -= 1
-            analyze_and_collect(
-                page, section_shot, section_capture.path, section, auth_state
-            )
+            shots.append((section_shot, section_capture.data, section))
 
+        analyze_and_collect(page, shots, auth_state)
         return capture.url, capture.links
 
-    if auth_enabled:
-        if remaining_screenshots < 2:
-            raise ValueError(
-                "Authentication requires at least 2 screenshots for pre/post login capture"
-            )
-        with browser_context(browser_config) as context:
-            capture_page(context, config.url, "pre_login", allow_sections=False)
-
     auth_result = AuthResult(storage_state_path=None, landing_url=None)
     auth_state: AuthState = "authenticated"
     start_url = config.url
-
-    with browser_context(
-        browser_config,
-        storage_state=_storage_state_path(auth),
-        http_credentials=_http_credentials(auth),
-    ) as context:
-        if auth and auth.mode == "form":
-            auth_result = perform_login(context, auth, config, run_dir)
-        if auth and auth.post_login_url:
-            start_url = auth.post_login_url
-
-        queue = deque([start_url])
-        seen: set[str] = set()
-        pages_in_crawl = 0
-
-        while queue and pages_in_crawl < config.max_pages:
-            if remaining_screenshots <= 0:
-                break
-            url = queue.popleft()
-            normalized = normalize_url(url)
-            if normalized in seen:
-                continue
-            seen.add(normalized)
-
-            result = capture_page(context, url, auth_state, allow_sections=True)
-            if result is None:
-                continue
-            pages_in_crawl += 1
-
-            _, links = result
-            for link in filter_links(links, config.url):
-                if link not in seen:
-                    queue.append(link)
-
-    if not pages:
-        raise RuntimeError("No pages were captured. Check the URL and try again.")
-
-    if config.style_consistency:
-        consistency_recs, consistency_items, consistency_raw = _run_style_consistency(
-            client=client,
-            pages=pages,
-            sections=sections,
-            screenshots=screenshots,
-            run_dir=run_dir,
-            batch_size=config.style_consistency_batch_size,
-        )
-        if consistency_recs:
-            recommendations.extend(consistency_recs)
-        if consistency_items:
-            analysis_items.extend(consistency_items)
-        if consistency_raw:
-            raw_responses.extend(consistency_raw)
+    crawl_scope = _crawl_scope(auth)
+    # Pages audited by a recent run, with the links they had at the time.
+    recent_pages: dict[str, list[str]] = {}
+    crawled_pages: list[tuple[str, list[str]]] = []
+
+    try:
+        if config.recrawl_interval_s > 0:
+            crawl_index = CrawlIndex(
+                config.output_dir / CRAWL_INDEX_FILENAME, crawl_scope
+            )
+            try:
+                recent_pages = crawl_index.recent(config.recrawl_interval_s)
+            finally:
+                crawl_index.close()
+
+        with browser_session(browser_config) as browser:
+            if auth_enabled:
+                with browser_context(browser_config, browser=browser) as context:
+                    capture_page(context, config.url, "pre_login", allow_sections=False)
+
+            with browser_context(
+                browser_config,
+                storage_state=_storage_state_path(auth),
+                http_credentials=_http_credentials(auth),
+                browser=browser,
+            ) as context:
+                if auth and auth.mode == "form":
+                    auth_result = perform_login(context, auth, config, run_dir)
+                if auth and auth.post_login_url:
+                    start_url = auth.post_login_url
+
+                queue = deque([start_url])
+                seen: set[str] = set()
+                # Always recapture the entry page so the crawl has a frontier.
+                recent_pages.pop(normalize_url(start_url), None)
+                pages_in_crawl = 0
+
+                while queue and pages_in_crawl < config.max_pages:
+                    if remaining_screenshots <= 0:
+                        break
+                    url = queue.popleft()
+                    normalized = normalize_url(url)
+                    if normalized in seen:
+                        continue
+                    seen.add(normalized)
+
+                    if normalized in recent_pages:
+                        # Skipped pages still expand their last known links so
+                        # pages only reachable through them are not lost.
+                        links = recent_pages[normalized]
+                    else:
+                        result = capture_page(
+                            context, url, auth_state, allow_sections=True
+                        )
+                        if result is None:
+                            continue
+                        pages_in_crawl += 1
+                        _, links = result
+                        crawled_pages.append((normalized, links))
+
+                    for link in filter_links(links, config.url):
+                        if link not in seen:
+                            queue.append(link)
+        collect_analyses(wait=True)
+
+        if not pages:
+            raise RuntimeError("No pages were captured. Check the URL and try again.")
+
+        if config.style_consistency:
+            consistency_recs, consistency_items, consistency_raw = (
+                _run_style_consistency(
+                    client=client,
+                    pages=pages,
+                    sections=sections,
+                    screenshots=screenshots,
+                    run_dir=run_dir,
+                    batch_size=config.style_consistency_batch_size,
+                    concurrency=config.analysis_concurrency,
+                )
+            )
+            if consistency_recs:
+                recommendations.extend(consistency_recs)
+            if consistency_items:
+                analysis_items.extend(consistency_items)
+            for record in consistency_raw:
+                raw_responses.write(record)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+        raw_responses.close()
+        if cache is not None:
+            cache.close()
 
     if auth:
         auth_summary = AuthSummary(
@@ -267,14 +355,65 @@ def run_audit(config: AuditConfig, settings: Settings) -> tuple[AuditResult, Pat
         screenshots=screenshots,
         recommendations=recommendations,
         analysis={"items": analysis_items} if analysis_items else None,
-        raw_response=raw_responses or None,
+        raw_response_path=RAW_RESPONSES_FILENAME if raw_responses.count else None,
         auth=auth_summary,
     )
     write_json(run_dir / "report.json", report)
 
+    if config.recrawl_interval_s > 0 and crawled_pages:
+        # Only mark pages once their report exists, so a failed run does not
+        # make the next one skip pages that were never reported.
+        crawl_index = CrawlIndex(config.output_dir / CRAWL_INDEX_FILENAME, crawl_scope)
+        try:
+            crawl_index.mark(crawled_pages)
+        finally:
+            crawl_index.close()
+
     return report, run_dir
 
 
+def _analyze_group(
+    client: GeminiClient,
+    page: PageTarget,
+    group: list[tuple[ScreenshotArtifact, bytes, SectionTarget | None]],
+    auth_state: AuthState | None,
+) -> tuple[list[dict | list], list[tuple[list[str], str]]]:
+    """Analyze a group of shots; return analyses and (screenshot ids, raw) pairs."""
+    raw_records: list[tuple[list[str], str]] = []
+    if len(group) > 1:
+        contexts = [
+            build_prompt_context(page, screenshot.id, section, auth_state)
+            for screenshot, _, section in group
+        ]
+        analyses, raw_response = client.analyze_images_batch(
+            build_batch_prompt(len(group)),
+            contexts,
+            [image for _, image, _ in group],
+        )
+        if raw_response:
+            raw_records.append(([shot.id for shot, _, _ in group], raw_response))
+        if analyses is not None:
+            return analyses, raw_records
+        logger.warning("Re-analyzing %s one screenshot at a time", page.url)
+
+    single_analyses: list[dict | list] = []
+    for screenshot, image, section in group:
+        prompt = build_prompt(page, screenshot.id, section, auth_state)
+        analysis, raw_response = client.analyze_image(prompt, image)
+        single_analyses.append(analysis)
+        if raw_response:
+            raw_records.append(([screenshot.id], raw_response))
+    return single_analyses, raw_records
+
+
+def _crawl_scope(auth: AuthConfig | None) -> str:
+    """Key the crawl index by who was logged in, since pages differ per user."""
+    if auth is None:
+        return "anonymous"
+    identity = auth.username or auth.storage_state_path or ""
+    return f"{auth.mode}:{identity}"
+
+
 def _resolve_auth(config: AuditConfig, settings: Settings) -> AuthConfig | None:
     if config.auth is None:
         return None
@@ -329,7 +468,8 @@ def _run_style_consistency(
     screenshots: list[ScreenshotArtifact],
     run_dir: Path,
     batch_size: int,
-) -> tuple[list, list[dict], list[str]]:
+    concurrency: int = 1,
+) -> tuple[list, list[dict], list[dict]]:
     if len(screenshots) < 2:
         return [], [], []
 
@@ -345,7 +485,6 @@ def _run_style_consistency(
         page = page_by_id.get(shot.page_id)
         section = section_by_id.get(shot.section_id) if shot.section_id else None
         contexts[shot.id] = {
-            "path": run_dir / shot.path,
             "page_url": _clean_prompt_text(page.url if page else ""),
             "page_title": _clean_prompt_text(page.title if page else ""),
             "section_title": _clean_prompt_text(section.title if section else ""),
@@ -354,16 +493,28 @@ def _run_style_consistency(
 
     recommendations: list = []
     analysis_items: list[dict] = []
-    raw_responses: list[str] = []
+    raw_responses: list[dict] = []
 
     batches = _build_style_consistency_batches(
         screenshots, anchors, batch_size, anchor_ids
     )
-    for batch_index, batch in enumerate(batches, start=1):
-        shots_block = _build_style_consistency_block(batch, contexts, anchor_ids)
-        prompt = build_consistency_prompt(shots_block)
-        image_paths = [contexts[shot.id]["path"] for shot in batch]
-        analysis, raw_response = client.analyze_images(prompt, image_paths)
+    requests = [
+        (
+            build_consistency_prompt(
+                _build_style_consistency_block(batch, contexts, anchor_ids)
+            ),
+            [run_dir / shot.path for shot in batch],
+        )
+        for batch in batches
+    ]
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        responses = list(
+            executor.map(lambda request: client.analyze_images(*request), requests)
+        )
+
+    for batch_index, (batch, (analysis, raw_response)) in enumerate(
+        zip(batches, responses, strict=True), start=1
+    ):
         recommendations.extend(normalize_recommendations(analysis))
         analysis_items.append(
             {
@@ -377,7 +528,14 @@ def _run_style_consistency(
             }
         )
         if raw_response:
-            raw_responses.append(raw_response)
+            raw_responses.append(
+                {
+                    "analysis_type": "style_consistency",
+                    "batch_index": batch_index,
+                    "screenshot_ids": [shot.id for shot in batch],
+                    "raw": raw_response,
+                }
+            )
 
     return recommendations, analysis_items, raw_responses
 
@@ -466,5 +624,15 @@ def _validate_limits(config: AuditConfig) -> None:
         raise ValueError("max_total_screenshots must be at least 1")
     if config.max_sections_per_page < 0:
         raise ValueError("max_sections_per_page must be at least 0")
+    if config.analysis_concurrency < 1:
+        raise ValueError("analysis_concurrency must be at least 1")
+    if not 1 <= config.analysis_image_quality <= 100:
+        raise ValueError("analysis_image_quality must be between 1 and 100")
+    if config.analysis_max_width < 0:
+        raise ValueError("analysis_max_width must be at least 0")
+    if config.analysis_total_budget_s < 1:
+        raise ValueError("analysis_total_budget_s must be at least 1")
+    if config.recrawl_interval_s < 0:
+        raise ValueError("recrawl_interval_s must be at least 0")
     if config.style_consistency and config.style_consistency_batch_size < 2:
         raise ValueError("style_consistency_batch_size must be at least 2")
@@ -5,7 +5,13 @@ from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 
-from playwright.sync_api import BrowserContext, HttpCredentials, Page, sync_playwright
+from playwright.sync_api import (
+    Browser,
+    BrowserContext,
+    HttpCredentials,
+    Page,
+    sync_playwright,
+)
 
 
 @dataclass
@@ -17,26 +23,42 @@ class BrowserConfig:
 
 
 @contextmanager
-def browser_context(
-    config: BrowserConfig,
-    storage_state: Path | None = None,
-    http_credentials: HttpCredentials | None = None,
-) -> Iterator[BrowserContext]:
+def browser_session(config: BrowserConfig) -> Iterator[Browser]:
     with sync_playwright() as playwright:
         browser = playwright.chromium.launch(headless=config.headless)
-        context = browser.new_context(
-            viewport={"width": config.viewport_width, "height": config.viewport_height},
-            user_agent=config.user_agent,
-            storage_state=str(storage_state) if storage_state else None,
-            http_credentials=http_credentials,
-        )
         try:
-            yield context
+            yield browser
         finally:
-            context.close()
             browser.close()
 
 
+@contextmanager
+def browser_context(
+    config: BrowserConfig,
+    storage_state: Path | None = None,
+    http_credentials: HttpCredentials | None = None,
+    browser: Browser | None = None,
+) -> Iterator[BrowserContext]:
+    if browser is None:
+        with browser_session(config) as session_browser:
+            with browser_context(
+                config, storage_state, http_credentials, session_browser
+            ) as context:
+                yield context
+        return
+
+    context = browser.new_context(
+        viewport={"width": config.viewport_width, "height": config.viewport_height},
+        user_agent=config.user_agent,
+        storage_state=str(storage_state) if storage_state else None,
+        http_credentials=http_credentials,
+    )
+    try:
+        yield context
+    finally:
+        context.close()
+
+
 @contextmanager
 def browser_page(config: BrowserConfig) -> Iterator[Page]:
     with browser_context(config) as context:
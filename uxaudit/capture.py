@@ -1,13 +1,37 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import logging
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any
 
 from playwright.sync_api import BrowserContext, ElementHandle, Page
 
 from uxaudit.browser import BrowserConfig, browser_page
 from uxaudit.config import AuditConfig
 
+logger = logging.getLogger(__name__)
+
+SCREENSHOT_SUFFIXES = {"png": ".png", "jpeg": ".jpg"}
+# JPEG quality for captured screenshots; high enough to keep UI text legible.
+JPEG_QUALITY = 90
+
+_SECTION_SELECTOR = ",".join(
+    [
+        "section",
+        "main",
+        "article",
+        "aside",
+        "header",
+        "footer",
+        "[role='region']",
+        "[role='main']",
+        "[role='banner']",
+        "[role='contentinfo']",
+        "[aria-labelledby]",
+    ]
+)
+
 
 @dataclass
 class SectionCapture:
@@ -16,6 +40,7 @@ class SectionCapture:
     path: Path
     width: int
     height: int
+    data: bytes = field(default=b"", repr=False)
 
 
 @dataclass
@@ -25,6 +50,7 @@ class CaptureResult:
     path: Path
     links: list[str]
     sections: list[SectionCapture]
+    data: bytes = field(default=b"", repr=False)
 
 
 def capture_full_page(
@@ -61,7 +87,9 @@ def _capture_with_page(
     page.goto(url, wait_until=config.wait_until, timeout=config.timeout_ms)
     title = page.title()
     links = _extract_nav_links(page)
-    page.screenshot(path=str(output_path), full_page=True)
+    data = page.screenshot(
+        path=str(output_path), full_page=True, **_screenshot_options(config)
+    )
     sections: list[SectionCapture] = []
     if max_sections > 0:
         sections = _capture_sections(page, output_path, config, max_sections)
@@ -71,9 +99,20 @@ def _capture_with_page(
         path=output_path,
         links=links,
         sections=sections,
+        data=data,
     )
 
 
+def screenshot_suffix(config: AuditConfig) -> str:
+    return SCREENSHOT_SUFFIXES[config.screenshot_format]
+
+
+def _screenshot_options(config: AuditConfig) -> dict[str, Any]:
+    if config.screenshot_format == "jpeg":
+        return {"type": "jpeg", "quality": JPEG_QUALITY}
+    return {"type": "png"}
+
+
 def _extract_nav_links(page: Page) -> list[str]:
     script = """
 () => {
@@ -99,121 +138,132 @@ def _capture_sections(
     max_sections: int,
 ) -> list[SectionCapture]:
     candidates = _collect_section_candidates(page)
+    metadata = _collect_section_metadata(page, candidates)
     min_width = config.viewport_width * 0.4
     min_height = 120
     max_height = config.viewport_height * 2.5
     seen: set[tuple[int, int, int, int]] = set()
     captures: list[SectionCapture] = []
 
-    for element in candidates:
+    for element, meta in zip(candidates, metadata, strict=False):
         if len(captures) >= max_sections:
             break
-        box = element.bounding_box()
-        if not box:
-            continue
-        width = int(box["width"])
-        height = int(box["height"])
+        width = int(meta["width"])
+        height = int(meta["height"])
         if width < min_width or height < min_height:
             continue
         if height > max_height:
             continue
-        signature = (round(box["x"]), round(box["y"]), width, height)
+        signature = (round(meta["x"]), round(meta["y"]), width, height)
         if signature in seen:
             continue
         seen.add(signature)
-        title = _section_title(element)
-        selector = _section_selector(element)
         section_path = output_path.with_name(
-            f"{output_path.stem}-section-{len(captures) + 1}.png"
+            f"{output_path.stem}-section-{len(captures) + 1}{output_path.suffix}"
         )
         try:
-            element.screenshot(path=str(section_path))
+            data = element.screenshot(
+                path=str(section_path), **_screenshot_options(config)
+            )
         except Exception:
             continue
         captures.append(
             SectionCapture(
-                title=title,
-                selector=selector,
+                title=meta.get("title") or None,
+                selector=meta.get("selector") or None,
                 path=section_path,
                 width=width,
                 height=height,
+                data=data,
             )
         )
     return captures
 
 
 def _collect_section_candidates(page: Page) -> list[ElementHandle]:
-    selectors = [
-        "section",
-        "main",
-        "article",
-        "aside",
-        "header",
-        "footer",
-        "[role='region']",
-        "[role='main']",
-        "[role='banner']",
-        "[role='contentinfo']",
-        "[aria-labelledby]",
-    ]
-    elements = list(page.query_selector_all(",".join(selectors)))
-    headings = page.query_selector_all("h2, h3")
-    for heading in headings:
-        handle = heading.evaluate_handle(
-            "el => el.closest('section, main, article, div')"
-        )
-        element = handle.as_element()
+    """Gather landmark and heading-container elements in one round-trip."""
+    script = """
+(selector) => {
+  const seen = new Set();
+  const elements = [];
+  const add = (el) => {
+    if (el && !seen.has(el)) {
+      seen.add(el);
+      elements.push(el);
+    }
+  };
+  document.querySelectorAll(selector).forEach(add);
+  document
+    .querySelectorAll('h2, h3')
+    .forEach((heading) => add(heading.closest('section, main, article, div')));
+  return elements;
+}
+"""
+    try:
+        handle = page.evaluate_handle(script, _SECTION_SELECTOR)
+    except Exception as exc:
+        logger.warning("Failed to collect sections on %s: %s", page.url, exc)
+        return []
+    try:
+        properties = handle.get_properties()
+    finally:
+        handle.dispose()
+    elements: list[ElementHandle] = []
+    for key in sorted((key for key in properties if key.isdigit()), key=int):
+        element = properties[key].as_element()
         if element:
             elements.append(element)
     return elements
 
 
-def _section_title(element: ElementHandle) -> str | None:
-    try:
-        title = element.evaluate(
-            """
-            (el) => {
-              const label = el.getAttribute('aria-label');
-              if (label) return label.trim();
-              const labelledby = el.getAttribute('aria-labelledby');
-              if (labelledby) {
-                const labelEl = document.getElementById(labelledby);
-                if (labelEl && labelEl.textContent) {
-                  return labelEl.textContent.trim();
-                }
-              }
-              const heading = el.querySelector('h1, h2, h3');
-              if (heading && heading.textContent) {
-                return heading.textContent.trim();
-              }
-              return '';
-            }
-            """
-        )
-    except Exception:
-        return None
-    if not title:
-        return None
-    return str(title)
-
-
-def _section_selector(element: ElementHandle) -> str | None:
+def _collect_section_metadata(
+    page: Page, elements: list[ElementHandle]
+) -> list[dict[str, Any]]:
+    """Read box, title and selector for every candidate in one round-trip."""
+    if not elements:
+        return []
+    script = """
+(elements) => elements.map((el) => {
+  const rect = el.getBoundingClientRect();
+  let title = el.getAttribute('aria-label') || '';
+  if (!title) {
+    const labelledby = el.getAttribute('aria-labelledby');
+    const labelEl = labelledby ? document.getElementById(labelledby) : null;
+    if (labelEl && labelEl.textContent) {
+      title = labelEl.textContent;
+    }
+  }
+  if (!title) {
+    const heading = el.querySelector('h1, h2, h3');
+    if (heading && heading.textContent) {
+      title = heading.textContent;
+    }
+  }
+  const tag = el.tagName.toLowerCase();
+  let selector = tag;
+  if (el.id) {
+    selector = `${tag}#${el.id}`;
+  } else if (el.classList && el.classList.length) {
+    const classes = Array.from(el.classList).slice(0, 2).join('.');
+    if (classes) selector = `${tag}.${classes}`;
+  }
+  return {
+    x: rect.x,
+    y: rect.y,
+    width: rect.width,
+    height: rect.height,
+    title: title.trim(),
+    selector,
+  };
+})
+"""
     try:
-        selector = element.evaluate(
-            """
-            (el) => {
-              const tag = el.tagName.toLowerCase();
-              if (el.id) return `${tag}#${el.id}`;
-              if (el.classList && el.classList.length) {
-                const classes = Array.from(el.classList).slice(0, 2).join('.');
-                if (classes) return `${tag}.${classes}`;
-              }
-              return tag;
-            }
-            """
-        )
-    except Exception:
-        return None
-    if not selector:
-        return None
-    return str(selector)
+        metadata = page.evaluate(script, elements)
+    except Exception as exc:
+        logger.warning("Failed to read section metadata on %s: %s", page.url, exc)
+        return []
+    if not isinstance(metadata, list):
+        return []
+    if not all(isinstance(item, dict) for item in metadata):
+        return []
+    return metadata
@@ -5,9 +5,7 @@ from typing import Literal
 
 import typer
 
-from uxaudit.audit import run_audit
 from uxaudit.config import AuditConfig, AuthConfig, Settings
-from uxaudit.redesign import run_redesign
 from uxaudit.schema import RedesignBrief
 
 app = typer.Typer(add_completion=False)
@@ -29,8 +27,17 @@ def _run(
     viewport_width: int,
     viewport_height: int,
     headless: bool,
+    screenshot_format: Literal["png", "jpeg"],
     style_consistency: bool,
     style_consistency_batch_size: int,
+    analysis_concurrency: int,
+    batch_analysis: bool,
+    analysis_image_quality: int,
+    analysis_max_width: int,
+    analysis_total_budget_s: int,
+    llm_cache: bool,
+    llm_cache_ttl_s: int,
+    recrawl_interval_s: int,
     wait_until: Literal["load", "domcontentloaded", "networkidle"],
     timeout_ms: int,
     user_agent: str | None,
@@ -47,28 +54,22 @@ def _run(
     auth_storage_state: Path | None,
     auth_save_storage_state: bool,
 ) -> None:
-    settings = Settings()
-    if not settings.api_key:
-        typer.echo("Missing API key. Set GEMINI_API_KEY or GOOGLE_API_KEY.")
-        raise typer.Exit(code=1)
-
-    if auth_mode != "none":
-        auth_config = AuthConfig(
-            mode=auth_mode,
-            login_url=auth_login_url,
-            post_login_url=auth_post_login_url,
-            username=auth_username or settings.auth_username,
-            password=auth_password or settings.auth_password,
-            username_selector=auth_username_selector,
-            password_selector=auth_password_selector,
-            submit_selector=auth_submit_selector,
-            success_selector=auth_success_selector,
-            success_url=auth_success_url,
-            storage_state_path=auth_storage_state,
-            save_storage_state=auth_save_storage_state,
-        )
-    else:
-        auth_config = None
+    settings = _load_settings()
+    auth_config = _build_auth_config(
+        settings,
+        mode=auth_mode,
+        login_url=auth_login_url,
+        post_login_url=auth_post_login_url,
+        username=auth_username,
+        password=auth_password,
+        username_selector=auth_username_selector,
+        password_selector=auth_password_selector,
+        submit_selector=auth_submit_selector,
+        success_selector=auth_success_selector,
+        success_url=auth_success_url,
+        storage_state_path=auth_storage_state,
+        save_storage_state=auth_save_storage_state,
+    )
 
     config = AuditConfig(
         url=url,
@@ -80,17 +81,70 @@ def _run(
         viewport_width=viewport_width,
         viewport_height=viewport_height,
         headless=headless,
+        screenshot_format=screenshot_format,
         style_consistency=style_consistency,
         style_consistency_batch_size=style_consistency_batch_size,
+        analysis_concurrency=analysis_concurrency,
+        batch_analysis=batch_analysis,
+        analysis_image_quality=analysis_image_quality,
+        analysis_max_width=analysis_max_width,
+        analysis_total_budget_s=analysis_total_budget_s,
+        llm_cache=llm_cache,
+        llm_cache_ttl_s=llm_cache_ttl_s,
+        recrawl_interval_s=recrawl_interval_s,
         wait_until=wait_until,
         timeout_ms=timeout_ms,
         user_agent=user_agent,
         auth=auth_config,
     )
+    # Playwright, Pillow and google-genai load here so --help stays fast.
+    from uxaudit.audit import run_audit
+
     _, run_dir = run_audit(config, settings)
     typer.echo(f"Report written to {run_dir / 'report.json'}")
 
 
+def _load_settings() -> Settings:
+    settings = Settings()
+    if not settings.api_key:
+        typer.echo("Missing API key. Set GEMINI_API_KEY or GOOGLE_API_KEY.")
+        raise typer.Exit(code=1)
+    return settings
+
+
+def _build_auth_config(
+    settings: Settings,
+    mode: Literal["none", "form", "storage_state", "basic"],
+    login_url: str | None,
+    post_login_url: str | None,
+    username: str | None,
+    password: str | None,
+    username_selector: str | None,
+    password_selector: str | None,
+    submit_selector: str | None,
+    success_selector: str | None,
+    success_url: str | None,
+    storage_state_path: Path | None,
+    save_storage_state: bool,
+) -> AuthConfig | None:
+    if mode == "none":
+        return None
+    return AuthConfig(
+        mode=mode,
+        login_url=login_url,
+        post_login_url=post_login_url,
+        username=username or settings.auth_username,
+        password=password or settings.auth_password,
+        username_selector=username_selector,
+        password_selector=password_selector,
+        submit_selector=submit_selector,
+        success_selector=success_selector,
+        success_url=success_url,
+        storage_state_path=storage_state_path,
+        save_storage_state=save_storage_state,
+    )
+
+
 def _split_list(value: str | None) -> list[str]:
     if not value:
         return []
@@ -129,28 +183,22 @@ def _run_redesign(
     auth_storage_state: Path | None,
     auth_save_storage_state: bool,
 ) -> None:
-    settings = Settings()
-    if not settings.api_key:
-        typer.echo("Missing API key. Set GEMINI_API_KEY or GOOGLE_API_KEY.")
-        raise typer.Exit(code=1)
-
-    if auth_mode != "none":
-        auth_config = AuthConfig(
-            mode=auth_mode,
-            login_url=auth_login_url,
-            post_login_url=auth_post_login_url,
-            username=auth_username or settings.auth_username,
-            password=auth_password or settings.auth_password,
-            username_selector=auth_username_selector,
-            password_selector=auth_password_selector,
-            submit_selector=auth_submit_selector,
-            success_selector=auth_success_selector,
-            success_url=auth_success_url,
-            storage_state_path=auth_storage_state,
-            save_storage_state=auth_save_storage_state,
-        )
-    else:
-        auth_config = None
+    settings = _load_settings()
+    auth_config = _build_auth_config(
+        settings,
+        mode=auth_mode,
+        login_url=auth_login_url,
+        post_login_url=auth_post_login_url,
+        username=auth_username,
+        password=auth_password,
+        username_selector=auth_username_selector,
+        password_selector=auth_password_selector,
+        submit_selector=auth_submit_selector,
+        success_selector=auth_success_selector,
+        success_url=auth_success_url,
+        storage_state_path=auth_storage_state,
+        save_storage_state=auth_save_storage_state,
+    )
 
     brief = RedesignBrief(
         goals=_split_list(goals),
@@ -179,6 +227,8 @@ def _run_redesign(
         auth=auth_config,
     )
 
+    from uxaudit.redesign import run_redesign
+
     result, run_dir = run_redesign(
         config,
         settings,
@@ -188,11 +238,13 @@ def _run_redesign(
         render_overwrite=render_overwrite,
         render_model=render_model,
     )
+    lines: list[str] = []
     if render_mode != "none":
         rendered = sum(1 for concept in result.concepts if concept.rendered)
-        typer.echo(f"Auto render: {rendered}/{len(result.concepts)} images generated")
-    typer.echo(f"Redesign written to {run_dir / 'redesign.json'}")
-    typer.echo(f"Preview written to {run_dir / 'redesign' / 'index.html'}")
+        lines.append(f"Auto render: {rendered}/{len(result.concepts)} images generated")
+    lines.append(f"Redesign written to {run_dir / 'redesign.json'}")
+    lines.append(f"Preview written to {run_dir / 'redesign' / 'index.html'}")
+    typer.echo("\n".join(lines))
 
 
 @app.command()
@@ -208,12 +260,39 @@ def analyze(
     viewport_width: int = typer.Option(1440, help="Viewport width"),
     viewport_height: int = typer.Option(900, help="Viewport height"),
     headless: bool = typer.Option(True, help="Run browser headless"),
+    screenshot_format: Literal["png", "jpeg"] = typer.Option(
+        "png", help="Image format of saved screenshots: png|jpeg"
+    ),
     style_consistency: bool = typer.Option(
         True, help="Run cross-screenshot style consistency analysis"
     ),
     style_consistency_batch_size: int = typer.Option(
         8, help="Screenshots per style consistency request"
     ),
+    analysis_concurrency: int = typer.Option(
+        4, help="Maximum Gemini analyses in flight while crawling"
+    ),
+    batch_analysis: bool = typer.Option(
+        True, help="Analyze a page and its sections in a single Gemini request"
+    ),
+    analysis_image_quality: int = typer.Option(
+        85, help="WebP quality (1-100) of screenshots sent to Gemini"
+    ),
+    analysis_max_width: int = typer.Option(
+        1440, help="Downscale screenshots sent to Gemini to this width (0 keeps size)"
+    ),
+    analysis_total_budget_s: int = typer.Option(
+        180, help="Time limit in seconds for one Gemini request, including retries"
+    ),
+    llm_cache: bool = typer.Option(
+        False, help="Reuse Gemini responses for identical screenshots and prompts"
+    ),
+    llm_cache_ttl_s: int = typer.Option(
+        7 * 24 * 60 * 60, help="Maximum age of cached Gemini responses in seconds"
+    ),
+    recrawl_interval_s: int = typer.Option(
+        0, help="Skip pages captured by a previous run within this many seconds"
+    ),
     wait_until: Literal["load", "domcontentloaded", "networkidle"] = typer.Option(
         "networkidle", help="Navigation wait condition"
     ),
@@ -258,8 +337,17 @@ def analyze(
         viewport_width=viewport_width,
         viewport_height=viewport_height,
         headless=headless,
+        screenshot_format=screenshot_format,
         style_consistency=style_consistency,
         style_consistency_batch_size=style_consistency_batch_size,
+        analysis_concurrency=analysis_concurrency,
+        batch_analysis=batch_analysis,
+        analysis_image_quality=analysis_image_quality,
+        analysis_max_width=analysis_max_width,
+        analysis_total_budget_s=analysis_total_budget_s,
+        llm_cache=llm_cache,
+        llm_cache_ttl_s=llm_cache_ttl_s,
+        recrawl_interval_s=recrawl_interval_s,
         wait_until=wait_until,
         timeout_ms=timeout_ms,
         user_agent=user_agent,
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal
 
@@ -59,8 +60,17 @@ class AuditConfig(BaseModel):
     timeout_ms: int = 45_000
     user_agent: str | None = None
     headless: bool = True
+    screenshot_format: Literal["png", "jpeg"] = "png"
     style_consistency: bool = True
     style_consistency_batch_size: int = 8
+    analysis_concurrency: int = 4
+    batch_analysis: bool = True
+    analysis_image_quality: int = 85
+    analysis_max_width: int = 1440
+    analysis_total_budget_s: int = 180
+    llm_cache: bool = False
+    llm_cache_ttl_s: int = 7 * 24 * 60 * 60
+    recrawl_interval_s: int = 0
     auth: AuthConfig | None = None
 
     @field_validator("model", mode="before")
@@ -69,6 +79,7 @@ class AuditConfig(BaseModel):
         return resolve_model(value)
 
 
+@lru_cache(maxsize=32)
 def resolve_model(value: str | None) -> str:
     if not value:
         return MODEL_ALIASES["flash"]
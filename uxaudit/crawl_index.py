@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+import orjson
+
+from uxaudit.utils import ensure_dir
+
+
+class CrawlIndex:
+    """SQLite record of when each normalized URL was last audited.
+
+    Rows are partitioned by ``scope`` so an anonymous crawl never skips pages
+    that were only audited while logged in, or as another user.
+    """
+
+    def __init__(self, path: Path, scope: str) -> None:
+        ensure_dir(path.parent)
+        self.path = path
+        self.scope = scope
+        self._conn = sqlite3.connect(str(path))
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS crawled_pages ("
+                "scope TEXT NOT NULL, url TEXT NOT NULL, "
+                "last_crawled_at REAL NOT NULL, links TEXT NOT NULL DEFAULT '[]', "
+                "PRIMARY KEY (scope, url))"
+            )
+
+    def recent(self, max_age_s: int) -> dict[str, list[str]]:
+        """Return URLs audited within ``max_age_s`` with the links they had."""
+        cutoff = time.time() - max_age_s
+        rows = self._conn.execute(
+            "SELECT url, links FROM crawled_pages "
+            "WHERE scope = ? AND last_crawled_at >= ?",
+            (self.scope, cutoff),
+        ).fetchall()
+        return {str(url): orjson.loads(links) for url, links in rows}
+
+    def mark(self, pages: Iterable[tuple[str, list[str]]]) -> None:
+        now = time.time()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO crawled_pages "
+                "(scope, url, last_crawled_at, links) VALUES (?, ?, ?, ?)",
+                [
+                    (self.scope, url, now, orjson.dumps(links).decode())
+                    for url, links in pages
+                ],
+            )
+
+    def close(self) -> None:
+        self._conn.close()
@@ -1,35 +1,40 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
-from urllib.parse import urldefrag, urlparse
+from urllib.parse import ParseResult, urldefrag, urlparse
+
+CRAWL_SCHEMES = frozenset({"http", "https"})
 
 
 def normalize_url(url: str) -> str:
-    cleaned, _ = urldefrag(url)
-    parsed = urlparse(cleaned)
-    if not parsed.scheme:
-        return cleaned
-    netloc = parsed.netloc.lower()
-    path = parsed.path or "/"
-    if path != "/" and path.endswith("/"):
-        path = path.rstrip("/")
-    normalized = parsed._replace(netloc=netloc, path=path)
-    return normalized.geturl()
+    return _normalize_parsed(url, urlparse(url))
 
 
 def filter_links(links: Iterable[str], base_url: str) -> list[str]:
-    base = urlparse(base_url)
-    base_netloc = base.netloc.lower()
-    filtered: list[str] = []
-    for link in links:
+    base_netloc = urlparse(base_url).netloc.lower()
+    filtered: dict[str, None] = {}
+    # Nav, header and footer often repeat the same hrefs; parse each once.
+    for link in dict.fromkeys(links):
         if not link:
             continue
         parsed = urlparse(link)
-        if parsed.scheme not in {"http", "https"}:
+        if parsed.scheme not in CRAWL_SCHEMES:
             continue
         if parsed.netloc.lower() != base_netloc:
             continue
-        normalized = normalize_url(link)
+        normalized = _normalize_parsed(link, parsed)
         if normalized:
-            filtered.append(normalized)
-    return filtered
+            filtered[normalized] = None
+    return list(filtered)
+
+
+def _normalize_parsed(url: str, parsed: ParseResult) -> str:
+    if not parsed.scheme:
+        cleaned, _ = urldefrag(url)
+        return cleaned
+    netloc = parsed.netloc.lower()
+    path = parsed.path or "/"
+    if path != "/" and path.endswith("/"):
+        path = path.rstrip("/")
+    normalized = parsed._replace(netloc=netloc, path=path, fragment="")
+    return normalized.geturl()
@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import io
+import logging
 import random
 import time
+from collections.abc import Callable, Sequence
+from functools import lru_cache
 from pathlib import Path
+from typing import TypeVar
 
+from PIL import Image
+
+from uxaudit.llm_cache import ResponseCache, cache_key
 from uxaudit.utils import extract_json
 
 try:
@@ -14,40 +22,93 @@ except ImportError as exc:
         "google-genai is required. Install dependencies with `pip install -e .`"
     ) from exc
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# WebP cannot encode images wider or taller than this.
+WEBP_MAX_DIMENSION = 16_383
+# Already-lossy formats gain little from a WebP round trip.
+PASSTHROUGH_FORMATS = frozenset({"JPEG", "WEBP"})
+RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Every analysis prompt asks for JSON, so let the API enforce it; the reply
+# then parses on extract_json's first orjson attempt.
+JSON_RESPONSE_CONFIG = types.GenerateContentConfig(
+    response_mime_type="application/json"
+)
+
+
+@lru_cache(maxsize=8)
+def _get_client(api_key: str, timeout_ms: int) -> genai.Client:
+    """Share one SDK client per key so runs reuse its pooled connections."""
+    return genai.Client(
+        api_key=api_key,
+        http_options=types.HttpOptions(timeout=timeout_ms),
+    )
+
 
 class GeminiClient:
-    def __init__(self, api_key: str, model: str) -> None:
+    def __init__(
+        self,
+        api_key: str,
+        model: str,
+        timeout_ms: int = 60_000,
+        cache: ResponseCache | None = None,
+        image_quality: int | None = None,
+        max_image_width: int = 0,
+        total_budget_s: float = 180.0,
+    ) -> None:
         if not api_key:
             raise ValueError("API key is required for Gemini analysis")
-        self.request_timeout_ms = 60_000
-        self.client = genai.Client(
-            api_key=api_key,
-            http_options=types.HttpOptions(timeout=self.request_timeout_ms),
-        )
+        self.request_timeout_ms = timeout_ms
+        self.client = _get_client(api_key, timeout_ms)
         self.model = model
+        self.cache = cache
+        self.image_quality = image_quality
+        self.max_image_width = max_image_width
         self.max_retries = 3
         self.initial_backoff = 1.0
         self.max_backoff = 8.0
+        self.total_budget_s = total_budget_s
 
-    def analyze_image(self, prompt: str, image_path: Path) -> tuple[dict | list, str]:
-        return self.analyze_images(prompt, [image_path])
+    def analyze_image(
+        self, prompt: str, image: Path | bytes
+    ) -> tuple[dict | list, str]:
+        return self.analyze_images(prompt, [image])
 
     def analyze_images(
-        self, prompt: str, image_paths: list[Path]
+        self, prompt: str, images: Sequence[Path | bytes]
     ) -> tuple[dict | list, str]:
-        if not image_paths:
+        if not images:
             return {}, ""
-        contents: list[types.Part | str] = [prompt]
-        for image_path in image_paths:
-            image_bytes = image_path.read_bytes()
-            contents.append(
-                types.Part.from_bytes(
-                    data=image_bytes,
-                    mime_type=_guess_mime_type(image_path),
-                )
-            )
+        contents: list[types.PartUnionDict] = [prompt]
+        for image in images:
+            contents.append(self._analysis_part(image))
         return self._generate(contents)
 
+    def analyze_images_batch(
+        self,
+        instructions: str,
+        prompts: list[str],
+        images: Sequence[Path | bytes],
+    ) -> tuple[list[dict | list] | None, str]:
+        """Analyze several images in one request, one result per image.
+
+        ``instructions`` is sent once; each image is preceded by its prompt.
+        The results are ``None`` when the reply has no results list at all.
+        """
+        if not images:
+            return [], ""
+        contents: list[types.PartUnionDict] = [instructions]
+        for prompt, image in zip(prompts, images, strict=True):
+            contents.append(prompt)
+            contents.append(self._analysis_part(image))
+        parsed, raw_response = self._generate(
+            contents, usable=lambda reply: _batch_items(reply) is not None
+        )
+        return _split_batch_results(parsed, len(images)), raw_response
+
     def generate_image(
         self,
         prompt: str,
@@ -56,7 +117,7 @@ class GeminiClient:
         response_modalities: list[str] | None = None,
         image_config: types.ImageConfig | None = None,
     ) -> bytes | None:
-        contents: list[types.Part | str] = [prompt]
+        contents: list[types.PartUnionDict] = [prompt]
         if reference_image:
             contents.append(
                 types.Part.from_bytes(
@@ -70,11 +131,11 @@ class GeminiClient:
             image_config=image_config,
         )
 
-        def _call():
+        def _call(http_options: types.HttpOptions):
             return self.client.models.generate_content(
                 model=model,
                 contents=contents,
-                config=config,
+                config=config.model_copy(update={"http_options": http_options}),
             )
 
         response = self._call_with_retry(_call)
@@ -96,51 +157,115 @@ class GeminiClient:
             image_config=image_config,
         )
 
-    def _generate(self, contents: list[types.Part | str]) -> tuple[dict | list, str]:
-        response = None
-        delay = self.initial_backoff
-        for attempt in range(self.max_retries + 1):
-            try:
-                response = self.client.models.generate_content(
-                    model=self.model,
-                    contents=contents,
-                )
-                break
-            except errors.APIError as exc:
-                if not _should_retry(exc) or attempt >= self.max_retries:
-                    raise
-            except Exception:
-                if attempt >= self.max_retries:
-                    raise
-            time.sleep(_with_jitter(delay))
-            delay = min(delay * 2, self.max_backoff)
-        if response is None:
-            return {}, ""
+    def _analysis_part(self, image: Path | bytes) -> types.Part:
+        if self.image_quality is None:
+            return _image_part(image)
+        data = image.read_bytes() if isinstance(image, Path) else image
+        data = _compress_image(data, self.max_image_width, self.image_quality)
+        return types.Part.from_bytes(data=data, mime_type=_sniff_mime_type(data))
+
+    def _generate(
+        self,
+        contents: list[types.PartUnionDict],
+        usable: Callable[[dict | list], bool] | None = None,
+    ) -> tuple[dict | list, str]:
+        key = None
+        if self.cache is not None:
+            key = cache_key(self.model, _content_key_parts(contents))
+            cached = self.cache.get(key)
+            if cached is not None:
+                return _parse_response_text(cached), cached
+        response = self._call_with_retry(
+            lambda http_options: self.client.models.generate_content(
+                model=self.model,
+                contents=contents,
+                config=JSON_RESPONSE_CONFIG.model_copy(
+                    update={"http_options": http_options}
+                ),
+            )
+        )
         text = getattr(response, "text", "") or ""
         if not text:
             return {}, ""
         try:
             parsed = extract_json(text)
         except ValueError:
-            parsed = {}
+            # Refusals and truncated replies would otherwise be replayed as
+            # empty analyses until the cache entry expires.
+            return {}, text
+        if self.cache is not None and key is not None:
+            if usable is None or usable(parsed):
+                self.cache.set(key, text)
         return parsed, text
 
-    def _call_with_retry(self, call):
-        response = None
+    def _call_with_retry(self, call: Callable[[types.HttpOptions], T]) -> T:
+        # Decorrelated jitter keeps parallel workers from retrying in lockstep.
+        # One deadline covers attempts and backoff alike, so each attempt only
+        # gets the time left in the budget.
+        deadline = time.monotonic() + self.total_budget_s
         delay = self.initial_backoff
-        for attempt in range(self.max_retries + 1):
+        attempt = 0
+        while True:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            timeout_ms = max(1, min(self.request_timeout_ms, remaining_ms))
             try:
-                response = call()
-                break
-            except errors.APIError as exc:
-                if not _should_retry(exc) or attempt >= self.max_retries:
+                return call(types.HttpOptions(timeout=timeout_ms))
+            except Exception as exc:
+                if isinstance(exc, errors.APIError) and not _should_retry(exc):
                     raise
-            except Exception:
                 if attempt >= self.max_retries:
                     raise
-            time.sleep(_with_jitter(delay))
-            delay = min(delay * 2, self.max_backoff)
-        return response
+                delay = _decorrelated_jitter(
+                    delay, self.initial_backoff, self.max_backoff
+                )
+                if time.monotonic() + delay > deadline:
+                    raise
+            attempt += 1
+            time.sleep(delay)
+
+
+def _image_part(image: Path | bytes) -> types.Part:
+    if isinstance(image, Path):
+        return types.Part.from_bytes(
+            data=image.read_bytes(), mime_type=_guess_mime_type(image)
+        )
+    return types.Part.from_bytes(data=image, mime_type=_sniff_mime_type(image))
+
+
+def _compress_image(data: bytes, max_width: int, quality: int) -> bytes:
+    """Re-encode a screenshot as WebP, downscaling it to ``max_width``."""
+    try:
+        with Image.open(io.BytesIO(data)) as img:
+            width, height = img.size
+            # Full-page screenshots are tall, so only the width is capped;
+            # capping the longest side would squeeze the text out of them.
+            scale = max_width / width if max_width and width > max_width else 1.0
+            # Opening only parses the header; lossy sources that already fit
+            # are sent as-is instead of being decoded and re-encoded.
+            if img.format in PASSTHROUGH_FORMATS and scale == 1.0:
+                return data
+            scale = min(scale, WEBP_MAX_DIMENSION / max(width, height))
+            if scale < 1.0:
+                size = (max(1, int(width * scale)), max(1, int(height * scale)))
+                img.thumbnail(size, Image.Resampling.LANCZOS)
+            # Playwright screenshots are usually RGB already; skip the copy.
+            rgb = img if img.mode == "RGB" else img.convert("RGB")
+            buffer = io.BytesIO()
+            # method=4 is libwebp's default; 6 costs ~40% more CPU for ~1%
+            # smaller files on screenshots.
+            rgb.save(buffer, "WEBP", quality=quality, method=4)
+    except Exception as exc:
+        logger.debug("Sending original image, WebP encoding failed: %s", exc)
+        return data
+    return buffer.getvalue()
+
+
+def _sniff_mime_type(data: bytes) -> str:
+    if data.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return "image/png"
 
 
 def _guess_mime_type(path: Path) -> str:
@@ -149,14 +274,55 @@ def _guess_mime_type(path: Path) -> str:
     return "image/png"
 
 
+def _parse_response_text(text: str) -> dict | list:
+    try:
+        return extract_json(text)
+    except ValueError:
+        return {}
+
+
+def _content_key_parts(contents: list[types.PartUnionDict]) -> list[str | bytes]:
+    parts: list[str | bytes] = []
+    for content in contents:
+        if isinstance(content, str):
+            parts.append(content)
+            continue
+        inline_data = content.inline_data if isinstance(content, types.Part) else None
+        if inline_data is not None:
+            parts.append(inline_data.mime_type or "")
+            parts.append(inline_data.data or b"")
+    return parts
+
+
+def _batch_items(parsed: dict | list) -> list | None:
+    items = parsed.get("results") if isinstance(parsed, dict) else parsed
+    return items if isinstance(items, list) else None
+
+
+def _split_batch_results(parsed: dict | list, count: int) -> list[dict | list] | None:
+    items = _batch_items(parsed)
+    if items is None:
+        logger.warning("Batch reply has no results list for %d images", count)
+        return None
+    if len(items) != count:
+        logger.warning(
+            "Batch reply has %d results for %d images; padding or truncating",
+            len(items),
+            count,
+        )
+    results: list[dict | list] = [
+        item if isinstance(item, dict | list) else {} for item in items[:count]
+    ]
+    results.extend({} for _ in range(count - len(results)))
+    return results
+
+
 def _should_retry(exc: errors.APIError) -> bool:
-    if isinstance(exc, errors.ServerError):
-        return True
-    return exc.code in {408, 429, 500, 502, 503, 504}
+    return exc.code in RETRYABLE_STATUS_CODES or isinstance(exc, errors.ServerError)
 
 
-def _with_jitter(delay: float) -> float:
-    return delay * (0.9 + random.random() * 0.2)
+def _decorrelated_jitter(previous: float, base: float, cap: float) -> float:
+    return min(cap, random.uniform(base, previous * 3))
 
 
 def _extract_inline_image_bytes(response: object) -> bytes | None:
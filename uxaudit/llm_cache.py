@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from uxaudit.utils import ensure_dir
+
+
+class ResponseCache:
+    """SQLite-backed store of raw Gemini responses keyed by request hash."""
+
+    def __init__(self, path: Path, ttl_s: int | None = None) -> None:
+        ensure_dir(path.parent)
+        self.path = path
+        self.ttl_s = ttl_s
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, raw TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            if ttl_s is not None:
+                # Drop expired rows up front so the database does not grow
+                # without bound across runs.
+                self._conn.execute(
+                    "DELETE FROM responses WHERE created_at < ?",
+                    (time.time() - ttl_s,),
+                )
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT raw, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        raw, created_at = row
+        if self.ttl_s is not None and time.time() - created_at > self.ttl_s:
+            return None
+        return str(raw)
+
+    def set(self, key: str, raw: str) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, raw, created_at) "
+                "VALUES (?, ?, ?)",
+                (key, raw, time.time()),
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def cache_key(model: str, parts: Iterable[str | bytes]) -> str:
+    digest = hashlib.sha256(model.encode())
+    for part in parts:
+        data = part.encode() if isinstance(part, str) else part
+        # Length-prefix each part so adjacent parts cannot collide.
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()
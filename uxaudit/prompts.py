@@ -1,13 +1,13 @@
 from __future__ import annotations
 
+from string import Formatter
+
 from uxaudit.schema import PageTarget, SectionTarget
 
-PROMPT_TEMPLATE = """You are a senior UX/UI auditor.
-Analyze the screenshot and return ONLY valid JSON with this shape:
-{{
+RECOMMENDATIONS_SHAPE = """{
   "summary": "short summary",
   "recommendations": [
-    {{
+    {
       "id": "rec-01",
       "title": "short title",
       "description": "what to change and how",
@@ -16,23 +16,58 @@ Analyze the screenshot and return ONLY valid JSON with this shape:
       "impact": "H|M|L",
       "effort": "S|M|L",
       "evidence": [
-        {{
-          "screenshot_id": "{screenshot_id}",
+        {
+          "screenshot_id": "<screenshot id from context>",
           "note": "what to look at",
           "location": "where in the UI"
-        }}
+        }
       ],
       "tags": ["tag1", "tag2"]
-    }}
+    }
   ]
-}}
+}
+"""
+
+# Static instructions come first and per-screenshot context last, so a
+# batched request can send the instructions once for all of its images.
+PROMPT_INSTRUCTIONS = (
+    """You are a senior UX/UI auditor.
+Analyze the screenshot and return ONLY valid JSON with this shape:
+"""
+    + RECOMMENDATIONS_SHAPE
+    + """
+Use the screenshot id from the context below in evidence.
+Return JSON only. No markdown, no code fences.
+"""
+)
+
+BATCH_PROMPT_INSTRUCTIONS = (
+    """You are a senior UX/UI auditor.
+You will receive several screenshots. Each image is preceded by its context.
+Analyze every screenshot independently and return ONLY valid JSON with this shape:
+{
+  "results": [
+    "one object per screenshot, in the same order as the images"
+  ]
+}
+
+Each object in results must have this shape:
+"""
+    + RECOMMENDATIONS_SHAPE
+    + """
+Rules:
+- The results array must contain one object per screenshot.
+- Keep results in the same order as the screenshots.
+- Use each screenshot's own id in its evidence.
+Return JSON only. No markdown, no code fences.
+"""
+)
 
+PROMPT_CONTEXT_TEMPLATE = """Screenshot id: {screenshot_id}
 Page URL: {page_url}
 Page title: {page_title}
 Auth state: {auth_state}
-{section_block}
-Return JSON only. No markdown, no code fences.
-"""
+{section_block}"""
 
 CONSISTENCY_PROMPT_TEMPLATE = """You are a senior UX/UI auditor.
 Analyze the screenshots and return ONLY valid JSON with this shape:
@@ -115,12 +150,59 @@ Guidance:
 Return JSON only. No markdown, no code fences.
 """
 
+CompiledTemplate = tuple[tuple[str, ...], tuple[str, ...]]
+
+
+def _compile_template(template: str) -> CompiledTemplate:
+    """Split a format string into literal segments and field names once."""
+    segments: list[str] = []
+    fields: list[str] = []
+    literal = ""
+    # Escaped braces come back as extra literal chunks; merge them.
+    for text, field_name, format_spec, conversion in Formatter().parse(template):
+        literal += text
+        if format_spec or conversion:
+            # _render only substitutes str(value); refuse what it cannot honour.
+            raise ValueError(
+                f"Unsupported conversion or format spec for field {field_name!r}"
+            )
+        if field_name is not None:
+            segments.append(literal)
+            fields.append(field_name)
+            literal = ""
+    segments.append(literal)
+    return tuple(segments), tuple(fields)
+
+
+def _render(compiled: CompiledTemplate, values: dict[str, object]) -> str:
+    segments, fields = compiled
+    parts = [segments[0]]
+    for field_name, segment in zip(fields, segments[1:], strict=True):
+        parts.append(str(values[field_name]))
+        parts.append(segment)
+    return "".join(parts)
+
+
+_PROMPT_CONTEXT = _compile_template(PROMPT_CONTEXT_TEMPLATE)
+_CONSISTENCY_PROMPT = _compile_template(CONSISTENCY_PROMPT_TEMPLATE)
+_REDESIGN_PROMPT = _compile_template(REDESIGN_PROMPT_TEMPLATE)
+
 
 def build_prompt(
     page: PageTarget,
     screenshot_id: str,
     section: SectionTarget | None = None,
     auth_state: str | None = None,
+) -> str:
+    context = build_prompt_context(page, screenshot_id, section, auth_state)
+    return f"{PROMPT_INSTRUCTIONS}\n{context}"
+
+
+def build_prompt_context(
+    page: PageTarget,
+    screenshot_id: str,
+    section: SectionTarget | None = None,
+    auth_state: str | None = None,
 ) -> str:
     page_title = page.title or ""
     auth_state_value = auth_state or "unknown"
@@ -131,17 +213,24 @@ def build_prompt(
         section_block = (
             f"Section title: {section_title}\nSection selector: {section_selector}\n"
         )
-    return PROMPT_TEMPLATE.format(
-        page_url=page.url,
-        page_title=page_title,
-        screenshot_id=screenshot_id,
-        auth_state=auth_state_value,
-        section_block=section_block,
+    return _render(
+        _PROMPT_CONTEXT,
+        {
+            "page_url": page.url,
+            "page_title": page_title,
+            "screenshot_id": screenshot_id,
+            "auth_state": auth_state_value,
+            "section_block": section_block,
+        },
     )
 
 
+def build_batch_prompt(count: int) -> str:
+    return f"{BATCH_PROMPT_INSTRUCTIONS}\nScreenshots in this request: {count}\n"
+
+
 def build_consistency_prompt(shots_block: str) -> str:
-    return CONSISTENCY_PROMPT_TEMPLATE.format(shots_block=shots_block)
+    return _render(_CONSISTENCY_PROMPT, {"shots_block": shots_block})
 
 
 def build_redesign_prompt(
@@ -152,10 +241,13 @@ def build_redesign_prompt(
 ) -> str:
     page_title = page.title or ""
     auth_state_value = auth_state or "unknown"
-    return REDESIGN_PROMPT_TEMPLATE.format(
-        page_url=page.url,
-        page_title=page_title,
-        auth_state=auth_state_value,
-        variants=variants,
-        brief_block=brief_block,
+    return _render(
+        _REDESIGN_PROMPT,
+        {
+            "page_url": page.url,
+            "page_title": page_title,
+            "auth_state": auth_state_value,
+            "variants": variants,
+            "brief_block": brief_block,
+        },
     )
@@ -4,6 +4,7 @@ import json
 import logging
 import re
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Literal
@@ -12,7 +13,7 @@ from google.genai import types
 
 from uxaudit.auth import AuthResult, perform_login
 from uxaudit.browser import BrowserConfig, browser_context
-from uxaudit.capture import capture_full_page
+from uxaudit.capture import capture_full_page, screenshot_suffix
 from uxaudit.config import AuditConfig, AuthConfig, Settings
 from uxaudit.crawler import filter_links, normalize_url
 from uxaudit.gemini_client import GeminiClient
@@ -109,33 +110,54 @@ def run_redesign(
         headless=config.headless,
     )
 
+    executor = ThreadPoolExecutor(max_workers=config.analysis_concurrency)
+    max_pending = config.analysis_concurrency * 2
+    pending: deque[
+        tuple[
+            Future[tuple[dict | list, str]],
+            PageTarget,
+            ScreenshotArtifact,
+            AuthState | None,
+            int,
+        ]
+    ] = deque()
+    brief_block = _build_brief_block(brief)
+
     def analyze_and_collect(
         page: PageTarget,
         screenshot: ScreenshotArtifact,
-        image_path: Path,
+        image: bytes,
         auth_state: AuthState | None,
         page_index: int,
     ) -> None:
-        brief_block = _build_brief_block(brief)
         prompt = build_redesign_prompt(page, variants, brief_block, auth_state)
-        analysis, raw_response = client.analyze_image(prompt, image_path)
-        normalized, summary = _normalize_concepts(
-            analysis, variants, page, screenshot, page_index
-        )
-        concepts.extend(normalized)
-        analysis_items.append(
-            {
-                "page_id": page.id,
-                "screenshot_id": screenshot.id,
-                "url": page.url,
-                "title": page.title,
-                "auth_state": auth_state,
-                "summary": summary,
-                "analysis": analysis if isinstance(analysis, dict) else None,
-            }
-        )
-        if raw_response:
-            raw_responses.append(raw_response)
+        future = executor.submit(client.analyze_image, prompt, image)
+        pending.append((future, page, screenshot, auth_state, page_index))
+        collect_analyses(wait=False)
+
+    def collect_analyses(wait: bool) -> None:
+        # Consume in submission order; pending work holds full-page screenshot
+        # bytes, so block once the backlog gets long.
+        while pending and (wait or pending[0][0].done() or len(pending) > max_pending):
+            future, page, screenshot, auth_state, page_index = pending.popleft()
+            analysis, raw_response = future.result()
+            normalized, summary = _normalize_concepts(
+                analysis, variants, page, screenshot, page_index
+            )
+            concepts.extend(normalized)
+            analysis_items.append(
+                {
+                    "page_id": page.id,
+                    "screenshot_id": screenshot.id,
+                    "url": page.url,
+                    "title": page.title,
+                    "auth_state": auth_state,
+                    "summary": summary,
+                    "analysis": analysis if isinstance(analysis, dict) else None,
+                }
+            )
+            if raw_response:
+                raw_responses.append(raw_response)
 
     def capture_page(
         context,
@@ -147,7 +169,9 @@ def run_redesign(
             return None
 
         page_counter += 1
-        screenshot_path = screenshots_dir / f"page-{page_counter}.png"
+        screenshot_path = (
+            screenshots_dir / f"page-{page_counter}{screenshot_suffix(config)}"
+        )
 
         try:
             capture = capture_full_page(
@@ -179,46 +203,50 @@ def run_redesign(
         screenshots.append(screenshot)
         remaining_screenshots -= 1
 
-        analyze_and_collect(page, screenshot, screenshot_path, auth_state, page_counter)
+        analyze_and_collect(page, screenshot, capture.data, auth_state, page_counter)
 
         return capture.url, capture.links
 
-    auth_result = AuthResult(storage_state_path=None, landing_url=None)
-    auth_state: AuthState = "authenticated"
-    start_url = config.url
-
-    with browser_context(
-        browser_config,
-        storage_state=_storage_state_path(auth),
-        http_credentials=_http_credentials(auth),
-    ) as context:
-        if auth and auth.mode == "form":
-            auth_result = perform_login(context, auth, config, run_dir)
-        if auth and auth.post_login_url:
-            start_url = auth.post_login_url
-
-        queue = deque([start_url])
-        seen: set[str] = set()
-        pages_in_crawl = 0
-
-        while queue and pages_in_crawl < config.max_pages:
-            if remaining_screenshots <= 0:
-                break
-            url = queue.popleft()
-            normalized = normalize_url(url)
-            if normalized in seen:
-                continue
-            seen.add(normalized)
-
-            result = capture_page(context, url, auth_state)
-            if result is None:
-                continue
-            pages_in_crawl += 1
-
-            _, links = result
-            for link in filter_links(links, config.url):
-                if link not in seen:
-                    queue.append(link)
+    try:
+        auth_result = AuthResult(storage_state_path=None, landing_url=None)
+        auth_state: AuthState = "authenticated"
+        start_url = config.url
+
+        with browser_context(
+            browser_config,
+            storage_state=_storage_state_path(auth),
+            http_credentials=_http_credentials(auth),
+        ) as context:
+            if auth and auth.mode == "form":
+                auth_result = perform_login(context, auth, config, run_dir)
+            if auth and auth.post_login_url:
+                start_url = auth.post_login_url
+
+            queue = deque([start_url])
+            seen: set[str] = set()
+            pages_in_crawl = 0
+
+            while queue and pages_in_crawl < config.max_pages:
+                if remaining_screenshots <= 0:
+                    break
+                url = queue.popleft()
+                normalized = normalize_url(url)
+                if normalized in seen:
+                    continue
+                seen.add(normalized)
+
+                result = capture_page(context, url, auth_state)
+                if result is None:
+                    continue
+                pages_in_crawl += 1
+
+                _, links = result
+                for link in filter_links(links, config.url):
+                    if link not in seen:
+                        queue.append(link)
+        collect_analyses(wait=True)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
 
     if not pages:
         raise RuntimeError("No pages were captured. Check the URL and try again.")
@@ -667,9 +695,7 @@ def _render_frame_hint(
             "in a single tall frame."
         )
     if "horizontal" in frame or aspect_ratio in HORIZONTAL_ASPECT_RATIOS:
-        return (
-            "Framing: full-page wide capture in one frame; avoid cropping."
-        )
+        return "Framing: full-page wide capture in one frame; avoid cropping."
     if render_notes and "detail" in render_notes.lower():
         return "Framing: single-screen detail view with full layout visible."
     return "Framing: full-page capture in one frame."
@@ -1404,3 +1430,5 @@ def _validate_redesign_limits(config: AuditConfig, variants: int) -> None:
         raise ValueError("max_total_screenshots must be at least 1")
     if config.max_total_screenshots < config.max_pages:
         raise ValueError("max_total_screenshots must be >= max_pages")
+    if config.analysis_concurrency < 1:
+        raise ValueError("analysis_concurrency must be at least 1")
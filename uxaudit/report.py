@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
+import orjson
 from pydantic import BaseModel
 
 
@@ -13,4 +14,35 @@ def write_json(path: Path, payload: BaseModel | dict | list) -> None:
         data = payload.model_dump(mode="json")
     else:
         data = payload
-    path.write_text(json.dumps(data, indent=2, ensure_ascii=True) + "\n")
+    path.write_bytes(_dumps(data, indent=True))
+
+
+def _dumps(data: Any, indent: bool = False) -> bytes:
+    option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if indent else 0)
+    try:
+        return orjson.dumps(data, option=option)
+    except orjson.JSONEncodeError:
+        # extract_json falls back to the stdlib for lone surrogates and
+        # integers beyond 64 bits, which orjson refuses to serialize.
+        text = json.dumps(data, ensure_ascii=True, indent=2 if indent else None)
+        return f"{text}\n".encode()
+
+
+class NdjsonWriter:
+    """Append JSON records one per line, creating the file on first write."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.count = 0
+        self._handle: BinaryIO | None = None
+
+    def write(self, record: dict) -> None:
+        if self._handle is None:
+            self._handle = self.path.open("wb")
+        self._handle.write(_dumps(record))
+        self.count += 1
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
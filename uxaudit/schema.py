@@ -105,6 +105,7 @@ class AuditResult(BaseModel):
     recommendations: list[Recommendation]
     analysis: dict | None = None
     raw_response: list[str] | str | None = None
+    raw_response_path: str | None = None
     auth: AuthSummary | None = None
 
 
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import json
-import re
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 from uuid import uuid4
 
+import orjson
+
 
 def build_run_id() -> str:
     timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
@@ -26,7 +28,7 @@ def extract_json(text: str) -> dict[str, object] | list[object]:
 
     for candidate in _json_candidates(cleaned):
         try:
-            parsed = json.loads(candidate)
+            parsed = _loads(candidate)
         except json.JSONDecodeError:
             continue
         if isinstance(parsed, dict):
@@ -37,6 +39,15 @@ def extract_json(text: str) -> dict[str, object] | list[object]:
     raise ValueError("Unable to parse JSON response")
 
 
+def _loads(text: str) -> object:
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        # orjson is stricter than the stdlib (NaN, oversized integers), so
+        # retry with json before giving up on a candidate.
+        return json.loads(text)
+
+
 def _strip_fences(text: str) -> str:
     lines = text.strip().splitlines()
     if lines and lines[0].startswith("```"):
@@ -46,15 +57,15 @@ def _strip_fences(text: str) -> str:
     return "\n".join(lines).strip()
 
 
-def _json_candidates(text: str) -> list[str]:
-    candidates = [text]
-    object_match = re.search(r"\{.*\}", text, re.DOTALL)
-    array_match = re.search(r"\[.*\]", text, re.DOTALL)
-    if object_match:
-        candidates.append(object_match.group(0))
-    if array_match:
-        candidates.append(array_match.group(0))
-    return candidates
+def _json_candidates(text: str) -> Iterator[str]:
+    # Yield lazily so the outer spans are only sliced when the whole text is
+    # not valid JSON; find/rfind match the old greedy `\{.*\}` regex spans.
+    yield text
+    for opener, closer in (("{", "}"), ("[", "]")):
+        start = text.find(opener)
+        end = text.rfind(closer)
+        if start != -1 and end > start:
+            yield text[start : end + 1]
 
 
 def ensure_dir(path: Path) -> None: